@@ -1,12 +1,27 @@
 import base64
 import math
+import zlib
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 from fpdf import FPDF
 import io
 
+# Australian resident tax brackets for 2025-26: (lower bound, upper bound, marginal rate)
+TAX_BRACKETS = [
+    (0, 18200, 0.0),
+    (18200, 45000, 0.16),
+    (45000, 135000, 0.30),
+    (135000, 190000, 0.37),
+    (190000, math.inf, 0.45),
+]
+MEDICARE_LEVY_RATE = 0.02
+
+# Annual FBT-exempt salary packaging cap for public hospital staff
+SALARY_PACKAGING_ANNUAL_CAP = 9010.0
+
 # Page configuration
 st.set_page_config(
     page_title="Kelly Salary Calculator",
@@ -229,26 +244,333 @@ def create_salary_pdf(calculation_data):
     return pdf
 
 
+YTD_EARNINGS_CATEGORIES = [
+    ('Ordinary Hours', 'ordinary_pay'),
+    ('Standard OT @1.5', 'standard_ot_15_pay'),
+    ('Standard OT @2.0', 'standard_ot_20_pay'),
+    ('Overtime @1.5', 'overtime_15_pay'),
+    ('Overtime @2.0', 'overtime_20_pay'),
+    ('Weekend Hours', 'weekend_pay'),
+    ('Public Holiday Hours', 'public_holiday_pay'),
+    ('Unrostered OT', 'unrostered_ot_pay'),
+    ('On Call', 'on_call_pay'),
+    ('Allowances', 'total_allowances'),
+]
+
+YTD_TOTAL_KEYS = [key for _, key in YTD_EARNINGS_CATEGORIES] + [
+    'total_payments', 'income_tax', 'car_park', 'salary_packaging',
+    'superannuation', 'net_pay', 'total_hours',
+]
+
+STATEMENT_COLUMNS = [
+    ('Pay Period', 62),
+    ('Hours', 20),
+    ('Gross', 28),
+    ('Tax', 26),
+    ('Super', 26),
+    ('Net Pay', 28),
+]
+
+
+class StreamingSalaryPDF(SalaryPDF):
+    """SalaryPDF that writes each page to a binary file object as soon as it is finished.
+
+    FPDF normally keeps every page in memory until output(). Here each page object is
+    emitted when the page closes, so memory stays flat however long the statement is.
+
+    This overrides private FPDF 1.7.2 internals, which is why requirements.txt pins it.
+    Page links are not supported. alias_nb_pages() is not supported either, since the
+    page count is unknown when a page is written. The '%PDF-' header is written when
+    the first page closes, so pdf_version changes after that are not reflected in it.
+    """
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self.bytes_written = 0
+        self.page_objects = []
+
+    def alias_nb_pages(self, alias='{nb}'):
+        raise NotImplementedError('StreamingSalaryPDF cannot replace the total page count alias')
+
+    def _flush(self):
+        data = self.buffer.encode('latin1')
+        self.stream.write(data)
+        self.bytes_written += len(data)
+        self.buffer = ''
+
+    def _newobj(self):
+        # Offsets must count the bytes already flushed to the stream
+        self.n += 1
+        self.offsets[self.n] = self.bytes_written + len(self.buffer)
+        self._out(str(self.n) + ' 0 obj')
+
+    def _endpage(self):
+        self.state = 1
+        if not self.page_objects:
+            self._putheader()
+        self._putpage(self.page)
+        del self.pages[self.page]
+        self._flush()
+
+    def _putpage(self, n):
+        self._newobj()
+        self.page_objects.append(self.n)
+        self._out('<</Type /Page')
+        self._out('/Parent 1 0 R')
+        if n in self.orientation_changes:
+            self._out('/MediaBox [0 0 %.2f %.2f]' % (self.fh_pt, self.fw_pt))
+        self._out('/Resources 2 0 R')
+        if self.pdf_version > '1.3':
+            self._out('/Group <</Type /Group /S /Transparency /CS /DeviceRGB>>')
+        self._out('/Contents ' + str(self.n + 1) + ' 0 R>>')
+        self._out('endobj')
+
+        content = self.pages[n]
+        if self.compress:
+            content = zlib.compress(content.encode('latin1'))
+            stream_filter = '/Filter /FlateDecode '
+        else:
+            stream_filter = ''
+        self._newobj()
+        self._out('<<' + stream_filter + '/Length ' + str(len(content)) + '>>')
+        self._putstream(content)
+        self._out('endobj')
+
+    def _putpages(self):
+        # Page objects are already written, only the pages root is left
+        if self.def_orientation == 'P':
+            w_pt, h_pt = self.fw_pt, self.fh_pt
+        else:
+            w_pt, h_pt = self.fh_pt, self.fw_pt
+        self.offsets[1] = self.bytes_written + len(self.buffer)
+        self._out('1 0 obj')
+        self._out('<</Type /Pages')
+        self._out('/Kids [' + ''.join(f'{obj} 0 R ' for obj in self.page_objects) + ']')
+        self._out('/Count ' + str(len(self.page_objects)))
+        self._out('/MediaBox [0 0 %.2f %.2f]' % (w_pt, h_pt))
+        self._out('>>')
+        self._out('endobj')
+
+    def _enddoc(self):
+        self._putpages()
+        # FPDF records the resources offset relative to its own buffer
+        self._flush()
+        resources_base = self.bytes_written
+        self._putresources()
+        self.offsets[2] += resources_base
+
+        # Info
+        self._newobj()
+        self._out('<<')
+        self._putinfo()
+        self._out('>>')
+        self._out('endobj')
+
+        # Catalog
+        self._newobj()
+        self._out('<<')
+        self._putcatalog()
+        self._out('>>')
+        self._out('endobj')
+
+        # Cross-ref
+        xref_offset = self.bytes_written + len(self.buffer)
+        self._out('xref')
+        self._out('0 ' + str(self.n + 1))
+        self._out('0000000000 65535 f ')
+        for i in range(1, self.n + 1):
+            self._out('%010d 00000 n ' % self.offsets[i])
+
+        # Trailer
+        self._out('trailer')
+        self._out('<<')
+        self._puttrailer()
+        self._out('>>')
+        self._out('startxref')
+        self._out(xref_offset)
+        self._out('%%EOF')
+        self.state = 3
+        self._flush()
+
+
+def _statement_table_header(pdf):
+    pdf.set_font('Arial', 'B', 10)
+    for title, width in STATEMENT_COLUMNS:
+        pdf.cell(width, 8, title, 1, 0, 'C')
+    pdf.ln()
+    pdf.set_font('Arial', '', 10)
+
+
+def write_ytd_statement(employees, stream):
+    """Write a multi-period year-to-date statement to a binary file object.
+
+    employees is an iterable of (employee_name, periods) pairs, where periods is an
+    iterable of calculation data dicts as returned by compute_pay. Both may be
+    generators; periods are consumed one at a time and pages are written as they fill.
+    Returns the number of pages written. Raises ValueError if there are no employees.
+    """
+    pdf = StreamingSalaryPDF(stream)
+
+    for employee_name, periods in employees:
+        pdf.add_page()
+
+        # Title
+        pdf.set_font('Arial', 'B', 18)
+        pdf.cell(0, 10, 'Year-to-Date Salary Statement', 0, 1, 'C')
+        pdf.set_font('Arial', '', 12)
+        pdf.cell(0, 8, f'Employee: {employee_name}', 0, 1, 'C')
+        pdf.ln(5)
+
+        # Per-period table
+        pdf.set_font('Arial', 'B', 14)
+        pdf.cell(0, 10, '1. Pay Periods', 0, 1)
+        _statement_table_header(pdf)
+
+        totals = dict.fromkeys(YTD_TOTAL_KEYS, 0)
+        period_count = 0
+        first_start = last_end = None
+
+        for period in periods:
+            if pdf.get_y() + 7 > pdf.page_break_trigger:
+                pdf.add_page()
+                _statement_table_header(pdf)
+
+            row = [
+                f'{period["start_date"]} to {period["end_date"]}',
+                f'{period["total_hours"]:g}',
+                f'${period["total_payments"]:,.2f}',
+                f'${period["income_tax"]:,.2f}',
+                f'${period["superannuation"]:,.2f}',
+                f'${period["net_pay"]:,.2f}',
+            ]
+            for i, ((_, width), value) in enumerate(zip(STATEMENT_COLUMNS, row)):
+                pdf.cell(width, 7, value, 1, 0, 'R' if i else 'L')
+            pdf.ln()
+
+            for key in YTD_TOTAL_KEYS:
+                totals[key] += period[key]
+            period_count += 1
+            first_start = first_start or period['start_date']
+            last_end = period['end_date']
+
+        pdf.ln(5)
+
+        # Year-to-date totals, kept together on one page
+        category_count = sum(1 for _, key in YTD_EARNINGS_CATEGORIES if totals[key] > 0)
+        if pdf.get_y() + 82 + 8 * category_count > pdf.page_break_trigger:
+            pdf.add_page()
+
+        pdf.set_font('Arial', 'B', 14)
+        pdf.cell(0, 10, '2. Year-to-Date Totals', 0, 1)
+        pdf.set_font('Arial', '', 12)
+        if period_count:
+            pdf.cell(0, 8, f'Periods: {period_count} ({first_start} to {last_end})', 0, 1)
+        else:
+            pdf.cell(0, 8, 'Periods: 0', 0, 1)
+        pdf.cell(0, 8, f'Total Hours: {totals["total_hours"]:g}', 0, 1)
+        pdf.ln(3)
+
+        for category, key in YTD_EARNINGS_CATEGORIES:
+            if totals[key] > 0:
+                pdf.cell(0, 8, f'{category}: ${totals[key]:,.2f}', 0, 1)
+
+        pdf.set_font('Arial', 'B', 12)
+        pdf.cell(0, 8, f'Total Gross: ${totals["total_payments"]:,.2f}', 0, 1)
+        pdf.ln(3)
+
+        pdf.set_font('Arial', '', 12)
+        pdf.cell(0, 8, f'Income Tax: ${totals["income_tax"]:,.2f}', 0, 1)
+        pdf.cell(0, 8, f'Car Park: ${totals["car_park"]:,.2f}', 0, 1)
+        pdf.cell(0, 8, f'Salary Packaging: ${totals["salary_packaging"]:,.2f}', 0, 1)
+        pdf.cell(0, 8, f'Superannuation: ${totals["superannuation"]:,.2f}', 0, 1)
+        pdf.set_font('Arial', 'B', 14)
+        pdf.cell(0, 10, f'NET PAY: ${totals["net_pay"]:,.2f}', 0, 1)
+
+    # Nothing has been written yet, close() would otherwise add a blank page
+    if pdf.page == 0:
+        raise ValueError('No employees to write a year-to-date statement for')
+
+    pdf.close()
+    return len(pdf.page_objects)
+
+
 def calculate_income_tax(income):
     """Calculate income tax based on Australian tax brackets for 2025-26"""
     annual_income = income * 26
     tax = 0
 
-    if annual_income <= 18200:
-        tax = 0
-    elif annual_income <= 45000:
-        tax = (annual_income - 18200) * 0.16
-    elif annual_income <= 135000:
-        tax = (45000 - 18200) * 0.16 + (annual_income - 45000) * 0.30
-    elif annual_income <= 190000:
-        tax = (45000 - 18200) * 0.16 + (135000 - 45000) * 0.30 + (annual_income - 135000) * 0.37
-    else:
-        tax = (45000 - 18200) * 0.16 + (135000 - 45000) * 0.30 + (190000 - 135000) * 0.37 + (
-                    annual_income - 190000) * 0.45
+    for lower, upper, rate in TAX_BRACKETS:
+        if annual_income > lower:
+            tax += (min(annual_income, upper) - lower) * rate
 
     return tax / 26
 
 
+def calculate_annual_tax_vectorized(annual_income):
+    """Calculate annual income tax plus Medicare levy for an array of annual taxable incomes"""
+    annual_income = np.asarray(annual_income, dtype=float)
+    lowers = np.array([lower for lower, _, _ in TAX_BRACKETS])
+    uppers = np.array([upper for _, upper, _ in TAX_BRACKETS])
+    rates = np.array([rate for _, _, rate in TAX_BRACKETS])
+
+    in_bracket = np.clip(annual_income[..., None] - lowers, 0, uppers - lowers)
+    return in_bracket @ rates + annual_income * MEDICARE_LEVY_RATE
+
+
+def optimise_salary_packaging(staff, annual_cap=SALARY_PACKAGING_ANNUAL_CAP, admin_fee_rate=0.0,
+                              period='fortnight'):
+    """Recommend a pre-tax salary packaging amount for every employee in a staff list.
+
+    staff is a DataFrame with a fortnightly gross 'total_payments' column. Optional
+    'packaging_cap' (annual) and 'admin_fee_rate' columns override the defaults per row.
+
+    Each packaged dollar saves the marginal tax rate plus Medicare levy at the current
+    taxable income and costs admin_fee_rate. Marginal rates only fall as taxable income
+    falls, so packaging pays until taxable income reaches the lower bound of the first
+    bracket where rate + levy exceeds the fee. That breakpoint gives the optimum directly,
+    clipped to the cap and to gross income.
+
+    Returns a DataFrame indexed like staff with amounts per fortnight or per year.
+    """
+    if period not in ('fortnight', 'annual'):
+        raise ValueError(f"period must be 'fortnight' or 'annual', not {period!r}")
+
+    annual_gross = staff['total_payments'].to_numpy(dtype=float) * 26
+    cap = staff['packaging_cap'].to_numpy(dtype=float) if 'packaging_cap' in staff else np.full(len(staff), annual_cap)
+    fee = staff['admin_fee_rate'].to_numpy(dtype=float) if 'admin_fee_rate' in staff else np.full(len(staff), admin_fee_rate)
+
+    for name, values in (('total_payments', annual_gross), ('packaging_cap', cap), ('admin_fee_rate', fee)):
+        invalid = ~(values >= 0)
+        if invalid.any():
+            raise ValueError(f"{name} must be a non-negative number, check rows: "
+                             f"{', '.join(map(str, staff.index[invalid][:10]))}")
+
+    # Breakpoint analysis: packaging pays down to the first bracket whose saving beats the fee
+    lowers = np.array([lower for lower, _, _ in TAX_BRACKETS] + [math.inf])
+    rates = np.array([rate for _, _, rate in TAX_BRACKETS])
+    first_paying_bracket = np.searchsorted(rates, fee - MEDICARE_LEVY_RATE, side='right')
+    taxable_floor = lowers[first_paying_bracket]
+
+    packaging = np.clip(annual_gross - taxable_floor, 0, np.maximum(np.minimum(cap, annual_gross), 0))
+    taxable_income = annual_gross - packaging
+
+    base_tax = calculate_annual_tax_vectorized(annual_gross)
+    income_tax = calculate_annual_tax_vectorized(taxable_income)
+    take_home = annual_gross - income_tax - packaging * fee
+    marginal_rate = rates[np.searchsorted(lowers[1:-1], taxable_income, side='left')] + MEDICARE_LEVY_RATE
+
+    scale = 1 / 26 if period == 'fortnight' else 1
+    return pd.DataFrame({
+        'recommended_packaging': packaging * scale,
+        'taxable_income': taxable_income * scale,
+        'income_tax': income_tax * scale,
+        'take_home': take_home * scale,
+        'take_home_gain': (take_home - (annual_gross - base_tax)) * scale,
+        'marginal_rate': marginal_rate,
+    }, index=staff.index)
+
+
 def display_calculation_results():
     """Display the calculation results from session state"""
     if 'calculation_data' not in st.session_state:
@@ -401,16 +723,34 @@ def calculate_pay(total_standard_hours, overtime_15_hours, overtime_20_hours,
                   uniform_allowance, education_allowance, meal_allowances, meal_rate,
                   car_park, salary_packaging, super_rate,
                   start_date, end_date):
-    # Apply overtime rules to standard hours
-    if total_standard_hours <= standard_hours:
-        ordinary_hours = total_standard_hours
-        standard_overtime_15_hours = 0
-        standard_overtime_20_hours = 0
-    else:
-        overtime_hours = total_standard_hours - standard_hours
-        standard_overtime_15_hours = min(2, overtime_hours)
-        standard_overtime_20_hours = max(0, overtime_hours - 2)
-        ordinary_hours = standard_hours
+    # Store all calculation data in session state
+    st.session_state.calculation_data = compute_pay(
+        total_standard_hours, overtime_15_hours, overtime_20_hours,
+        total_weekend_hours, total_public_holiday_hours,
+        unrostered_overtime_hours, on_call_hours, on_call_rate,
+        hourly_rate, standard_hours,
+        uniform_allowance, education_allowance, meal_allowances, meal_rate,
+        car_park, salary_packaging, super_rate,
+        start_date, end_date
+    )
+
+    st.session_state.calculation_complete = True
+
+
+def calculate_earnings(total_standard_hours, overtime_15_hours, overtime_20_hours,
+                       total_weekend_hours, total_public_holiday_hours,
+                       unrostered_overtime_hours, on_call_hours, on_call_rate,
+                       hourly_rate, standard_hours,
+                       uniform_allowance, education_allowance, meal_allowances, meal_rate):
+    """Calculate hours and pay for each earnings category.
+
+    Works on plain numbers for compute_pay and on numpy arrays for batch validation.
+    """
+    # Apply overtime rules to standard hours: 2 hours at 1.5x, the rest at 2.0x
+    ordinary_hours = np.minimum(total_standard_hours, standard_hours)
+    overtime_hours = np.maximum(total_standard_hours - standard_hours, 0)
+    standard_overtime_15_hours = np.minimum(overtime_hours, 2)
+    standard_overtime_20_hours = np.maximum(overtime_hours - 2, 0)
 
     # Calculate payments for each category
     ordinary_pay = ordinary_hours * hourly_rate
@@ -432,11 +772,50 @@ def calculate_pay(total_standard_hours, overtime_15_hours, overtime_20_hours,
                       overtime_15_pay + overtime_20_pay + unrostered_ot_pay +
                       on_call_pay + weekend_pay + public_holiday_pay + total_allowances)
 
-    # Calculate deductions
-    taxable_income = total_payments
+    return {
+        "ordinary_hours": ordinary_hours,
+        "ordinary_pay": ordinary_pay,
+        "standard_overtime_15_hours": standard_overtime_15_hours,
+        "standard_ot_15_pay": standard_ot_15_pay,
+        "standard_overtime_20_hours": standard_overtime_20_hours,
+        "standard_ot_20_pay": standard_ot_20_pay,
+        "overtime_15_pay": overtime_15_pay,
+        "overtime_20_pay": overtime_20_pay,
+        "unrostered_ot_pay": unrostered_ot_pay,
+        "on_call_pay": on_call_pay,
+        "weekend_pay": weekend_pay,
+        "public_holiday_pay": public_holiday_pay,
+        "meal_allowance_pay": meal_allowance_pay,
+        "total_allowances": total_allowances,
+        "total_payments": total_payments,
+    }
+
+
+def compute_pay(total_standard_hours, overtime_15_hours, overtime_20_hours,
+                total_weekend_hours, total_public_holiday_hours,
+                unrostered_overtime_hours, on_call_hours, on_call_rate,
+                hourly_rate, standard_hours,
+                uniform_allowance, education_allowance, meal_allowances, meal_rate,
+                car_park, salary_packaging, super_rate,
+                start_date, end_date):
+    """Calculate one fortnight of pay and return the calculation data without touching session state"""
+    earnings = calculate_earnings(
+        total_standard_hours, overtime_15_hours, overtime_20_hours,
+        total_weekend_hours, total_public_holiday_hours,
+        unrostered_overtime_hours, on_call_hours, on_call_rate,
+        hourly_rate, standard_hours,
+        uniform_allowance, education_allowance, meal_allowances, meal_rate
+    )
+    ordinary_hours = earnings['ordinary_hours']
+    standard_overtime_15_hours = earnings['standard_overtime_15_hours']
+    standard_overtime_20_hours = earnings['standard_overtime_20_hours']
+    total_payments = earnings['total_payments']
+
+    # Calculate deductions - salary packaging comes out before tax
+    taxable_income = max(total_payments - salary_packaging, 0)
 
     base_tax = calculate_income_tax(taxable_income)
-    medicare_levy = taxable_income * 0.02  # Always include Medicare for now
+    medicare_levy = taxable_income * MEDICARE_LEVY_RATE  # Always include Medicare for now
     income_tax = base_tax + medicare_levy
 
     superannuation = total_payments * (super_rate / 100)
@@ -448,36 +827,36 @@ def calculate_pay(total_standard_hours, overtime_15_hours, overtime_20_hours,
                    overtime_15_hours + overtime_20_hours + unrostered_overtime_hours +
                    on_call_hours + total_weekend_hours + total_public_holiday_hours)
 
-    # Store all calculation data in session state
-    st.session_state.calculation_data = {
+    return {
         "hourly_rate": hourly_rate,
         "standard_hours": standard_hours,
         "start_date": start_date.strftime("%Y-%m-%d"),
         "end_date": end_date.strftime("%Y-%m-%d"),
         "ordinary_hours": ordinary_hours,
-        "ordinary_pay": ordinary_pay,
+        "ordinary_pay": earnings["ordinary_pay"],
         "standard_overtime_15_hours": standard_overtime_15_hours,
-        "standard_ot_15_pay": standard_ot_15_pay,
+        "standard_ot_15_pay": earnings["standard_ot_15_pay"],
         "standard_overtime_20_hours": standard_overtime_20_hours,
-        "standard_ot_20_pay": standard_ot_20_pay,
+        "standard_ot_20_pay": earnings["standard_ot_20_pay"],
         "overtime_15_hours": overtime_15_hours,
-        "overtime_15_pay": overtime_15_pay,
+        "overtime_15_pay": earnings["overtime_15_pay"],
         "overtime_20_hours": overtime_20_hours,
-        "overtime_20_pay": overtime_20_pay,
+        "overtime_20_pay": earnings["overtime_20_pay"],
         "weekend_hours": total_weekend_hours,
-        "weekend_pay": weekend_pay,
+        "weekend_pay": earnings["weekend_pay"],
         "public_holiday_hours": total_public_holiday_hours,
-        "public_holiday_pay": public_holiday_pay,
+        "public_holiday_pay": earnings["public_holiday_pay"],
         "unrostered_ot_hours": unrostered_overtime_hours,
-        "unrostered_ot_pay": unrostered_ot_pay,
+        "unrostered_ot_pay": earnings["unrostered_ot_pay"],
         "on_call_hours": on_call_hours,
-        "on_call_pay": on_call_pay,
+        "on_call_pay": earnings["on_call_pay"],
         "uniform_allowance": uniform_allowance,
         "education_allowance": education_allowance,
         "meal_allowances": meal_allowances,
-        "meal_allowance_pay": meal_allowance_pay,
-        "total_allowances": total_allowances,
+        "meal_allowance_pay": earnings["meal_allowance_pay"],
+        "total_allowances": earnings["total_allowances"],
         "total_payments": total_payments,
+        "taxable_income": taxable_income,
         "income_tax": income_tax,
         "car_park": car_park,
         "salary_packaging": salary_packaging,
@@ -489,7 +868,117 @@ def calculate_pay(total_standard_hours, overtime_15_hours, overtime_20_hours,
         "effective_hourly_rate": net_pay / total_hours if total_hours > 0 else 0
     }
 
-    st.session_state.calculation_complete = True
+
+PAY_HOUR_FIELDS = [
+    'total_standard_hours', 'overtime_15_hours', 'overtime_20_hours',
+    'total_weekend_hours', 'total_public_holiday_hours',
+    'unrostered_overtime_hours', 'on_call_hours',
+]
+
+PAY_AMOUNT_FIELDS = [
+    'on_call_rate', 'hourly_rate', 'standard_hours',
+    'uniform_allowance', 'education_allowance', 'meal_allowances', 'meal_rate',
+    'car_park', 'salary_packaging', 'super_rate',
+]
+
+PAY_DATE_FIELDS = ['start_date', 'end_date']
+
+HOURS_IN_FORTNIGHT = 14 * 24
+
+VALIDATION_RULES = {
+    'missing': 'value is missing',
+    'invalid': 'value could not be read',
+    'non_negative': 'must not be negative',
+    'max_fortnight_hours': f'hours add up to more than the {HOURS_IN_FORTNIGHT} hours in a fortnight',
+    'max_percentage': 'must not be more than 100%',
+    'max_gross_pay': 'must not be more than the gross pay for the fortnight',
+    'end_before_start': 'end date is before the start date',
+    'fortnight_length': 'pay period must cover exactly 14 days',
+}
+
+
+def coerce_pay_inputs(batch):
+    """Return a copy of batch with every compute_pay input column converted to a usable type.
+
+    Numbers become floats and dates become Timestamps, so text columns such as a frame
+    read back with pd.read_csv can be passed to compute_pay. Values that will not
+    convert become NaN/NaT. Other columns are kept as they are.
+    """
+    missing_columns = [field for field in PAY_HOUR_FIELDS + PAY_AMOUNT_FIELDS + PAY_DATE_FIELDS
+                       if field not in batch]
+    if missing_columns:
+        raise ValueError(f"Missing pay input columns: {', '.join(missing_columns)}")
+
+    coerced = batch.copy()
+    for field in PAY_HOUR_FIELDS + PAY_AMOUNT_FIELDS:
+        coerced[field] = pd.to_numeric(batch[field], errors='coerce').astype(float)
+    for field in PAY_DATE_FIELDS:
+        coerced[field] = pd.to_datetime(batch[field], errors='coerce')
+    return coerced
+
+
+def validate_pay_inputs(batch):
+    """Check a batch of compute_pay inputs and report every rule each row breaks.
+
+    batch is a DataFrame with one column per compute_pay argument. Every rule is
+    evaluated as a boolean mask over the whole batch, so all failures are reported
+    rather than stopping at the first one.
+
+    Rules are checked against the coerce_pay_inputs version of batch. Rows that
+    validate clean can be passed to compute_pay from that coerced frame, not from
+    the raw one.
+
+    Returns a DataFrame with 'row' (the batch index label), 'field' and 'rule'
+    columns, empty if every row is valid. Rule descriptions are in VALIDATION_RULES.
+    """
+    coerced = coerce_pay_inputs(batch)
+    checks = []
+
+    # Values that will not convert, or are infinite, are reported as invalid, not raised
+    numeric = {}
+    for field in PAY_HOUR_FIELDS + PAY_AMOUNT_FIELDS:
+        missing = batch[field].isna().to_numpy()
+        numeric[field] = coerced[field].to_numpy(dtype=float)
+        checks.append((field, 'missing', missing))
+        checks.append((field, 'invalid', ~np.isfinite(numeric[field]) & ~missing))
+        checks.append((field, 'non_negative', numeric[field] < 0))
+
+    total_hours = np.nansum([numeric[field] for field in PAY_HOUR_FIELDS], axis=0)
+    checks.append(('total_hours', 'max_fortnight_hours', total_hours > HOURS_IN_FORTNIGHT))
+    checks.append(('super_rate', 'max_percentage', numeric['super_rate'] > 100))
+
+    total_payments = calculate_earnings(
+        numeric['total_standard_hours'], numeric['overtime_15_hours'], numeric['overtime_20_hours'],
+        numeric['total_weekend_hours'], numeric['total_public_holiday_hours'],
+        numeric['unrostered_overtime_hours'], numeric['on_call_hours'], numeric['on_call_rate'],
+        numeric['hourly_rate'], numeric['standard_hours'],
+        numeric['uniform_allowance'], numeric['education_allowance'],
+        numeric['meal_allowances'], numeric['meal_rate']
+    )['total_payments']
+    checks.append(('salary_packaging', 'max_gross_pay', numeric['salary_packaging'] > total_payments))
+
+    dates = {}
+    for field in PAY_DATE_FIELDS:
+        missing = batch[field].isna().to_numpy()
+        dates[field] = coerced[field].to_numpy(dtype='datetime64[D]')
+        checks.append((field, 'missing', missing))
+        checks.append((field, 'invalid', np.isnat(dates[field]) & ~missing))
+    start, end = dates['start_date'], dates['end_date']
+
+    # Both dates are inclusive, so a fortnight ends 13 days after it starts
+    dated = ~np.isnat(start) & ~np.isnat(end)
+    checks.append(('end_date', 'end_before_start', dated & (end < start)))
+    checks.append(('end_date', 'fortnight_length', dated & (end >= start) & (end - start != np.timedelta64(13, 'D'))))
+
+    rows = [np.flatnonzero(mask) for _, _, mask in checks]
+    positions = np.concatenate(rows)
+    order = np.argsort(positions, kind='stable')
+
+    return pd.DataFrame({
+        'row': batch.index[positions[order]],
+        'field': np.repeat([field for field, _, _ in checks], [len(r) for r in rows])[order],
+        'rule': np.repeat([rule for _, rule, _ in checks], [len(r) for r in rows])[order],
+    })
 
 
 def main():
@@ -685,22 +1174,32 @@ def main():
             st.write("**Deductions**")
             car_park = st.number_input("Car Park Deduction", min_value=0.0, value=86.30, step=0.01, key="car_park")
             salary_packaging = st.number_input("Salary Packaging", min_value=0.0, value=365.60, step=0.01,
+                                               help="Pre-tax packaging amount, reduces taxable income",
                                                key="salary_pack")
             super_rate = st.number_input("Superannuation Rate (%)", min_value=0.0, max_value=20.0, value=12.0, step=0.1,
                                          key="super")
 
         # Calculate pay button
         if st.button("Calculate Fortnightly Pay", type="primary", use_container_width=True, key="calculate_pay"):
-            calculate_pay(
-                total_standard_hours, overtime_15_hours, overtime_20_hours,
-                total_weekend_hours, total_public_holiday_hours,
-                unrostered_overtime_hours, on_call_hours, on_call_rate,
-                hourly_rate, standard_fortnight_hours,
-                uniform_allowance, education_allowance, meal_allowances, meal_rate,
-                car_park, salary_packaging, super_rate,
-                start_date, end_date
+            pay_inputs = dict(
+                total_standard_hours=total_standard_hours, overtime_15_hours=overtime_15_hours,
+                overtime_20_hours=overtime_20_hours, total_weekend_hours=total_weekend_hours,
+                total_public_holiday_hours=total_public_holiday_hours,
+                unrostered_overtime_hours=unrostered_overtime_hours, on_call_hours=on_call_hours,
+                on_call_rate=on_call_rate, hourly_rate=hourly_rate, standard_hours=standard_fortnight_hours,
+                uniform_allowance=uniform_allowance, education_allowance=education_allowance,
+                meal_allowances=meal_allowances, meal_rate=meal_rate,
+                car_park=car_park, salary_packaging=salary_packaging, super_rate=super_rate,
+                start_date=start_date, end_date=end_date
             )
-            st.rerun()
+            errors = validate_pay_inputs(pd.DataFrame([pay_inputs]))
+
+            if errors.empty:
+                calculate_pay(**pay_inputs)
+                st.rerun()
+            else:
+                for error in errors.itertuples():
+                    st.error(f"❌ {error.field.replace('_', ' ').title()}: {VALIDATION_RULES[error.rule]}")
 
     # Display results if calculation is complete
     if st.session_state.calculation_complete:
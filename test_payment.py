@@ -0,0 +1,258 @@
+import io
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pypdf
+import pytest
+
+import Payment
+
+PAY_INPUTS = dict(
+    total_standard_hours=80.0, overtime_15_hours=2.0, overtime_20_hours=12.0,
+    total_weekend_hours=8.0, total_public_holiday_hours=4.0,
+    unrostered_overtime_hours=1.0, on_call_hours=3.0, on_call_rate=43.56,
+    hourly_rate=45.85395, standard_hours=76,
+    uniform_allowance=19.74, education_allowance=181.8, meal_allowances=2, meal_rate=11.13,
+    car_park=86.30, salary_packaging=365.60, super_rate=12.0,
+    start_date=date(2025, 7, 7), end_date=date(2025, 7, 20),
+)
+
+
+def make_periods(count, **overrides):
+    inputs = dict(PAY_INPUTS, **overrides)
+    for i in range(count):
+        start = inputs['start_date'] + timedelta(days=14 * i)
+        yield Payment.compute_pay(**dict(inputs, start_date=start, end_date=start + timedelta(days=13)))
+
+
+def write_statement(employees):
+    stream = io.BytesIO()
+    pages = Payment.write_ytd_statement(employees, stream)
+    return pages, stream.getvalue()
+
+
+def test_ytd_statement_parses_in_strict_mode():
+    employees = [('Alice', make_periods(52)), ('Bob', make_periods(0)), ('Carol', make_periods(3))]
+
+    pages, data = write_statement(employees)
+    reader = pypdf.PdfReader(io.BytesIO(data), strict=True)
+
+    assert len(reader.pages) == pages
+    text = [page.extract_text() for page in reader.pages]
+    assert sum('Year-to-Date Salary Statement' in page for page in text) == 3
+    assert 'Periods: 0' in ''.join(text)
+    assert 'Periods: 52 (2025-07-07 to 2027-07-04)' in ''.join(text)
+
+
+def test_ytd_statement_xref_offsets_point_at_objects():
+    _, data = write_statement([('Alice', make_periods(30)), ('Bob', make_periods(0))])
+
+    xref_offset = int(data.rsplit(b'startxref', 1)[1].split()[0])
+    assert data[xref_offset:].startswith(b'xref')
+    lines = data[xref_offset:].split(b'\n')
+    object_count = int(lines[1].split()[1])
+    for number in range(1, object_count):
+        offset = int(lines[2 + number][:10])
+        assert data[offset:].startswith(b'%d 0 obj' % number)
+
+
+def test_ytd_totals_are_not_split_across_pages():
+    # Every earnings category is non-zero, and the table ends low on its page
+    for period_count in list(range(1, 10)) + list(range(34, 40)):
+        _, data = write_statement([('Alice', make_periods(period_count))])
+        reader = pypdf.PdfReader(io.BytesIO(data), strict=True)
+        totals_pages = [page.extract_text() for page in reader.pages
+                        if '2. Year-to-Date Totals' in page.extract_text()]
+        assert len(totals_pages) == 1
+        assert 'NET PAY' in totals_pages[0]
+        assert 'Public Holiday Hours' in totals_pages[0]
+
+
+def test_ytd_statement_rejects_no_employees():
+    stream = io.BytesIO()
+
+    with pytest.raises(ValueError, match='No employees'):
+        Payment.write_ytd_statement(iter([]), stream)
+    assert stream.getvalue() == b''
+
+
+def test_streaming_pdf_rejects_page_count_alias():
+    with pytest.raises(NotImplementedError):
+        Payment.StreamingSalaryPDF(io.BytesIO()).alias_nb_pages()
+
+
+BRACKET_EDGES = [lower for lower, _, _ in Payment.TAX_BRACKETS[1:]]
+
+
+@pytest.mark.parametrize('annual_income', [0, 1, 100000, 250000] +
+                         [edge + delta for edge in BRACKET_EDGES for delta in (-0.01, 0, 0.01)])
+def test_scalar_and_vectorized_tax_agree(annual_income):
+    scalar = Payment.calculate_income_tax(annual_income / 26) * 26 + annual_income * Payment.MEDICARE_LEVY_RATE
+    vectorized = Payment.calculate_annual_tax_vectorized([annual_income])[0]
+    assert vectorized == pytest.approx(scalar, abs=1e-6)
+
+
+def test_income_tax_at_bracket_edges():
+    expected = {18200: 0, 45000: 4288, 135000: 31288, 190000: 51638}
+    for annual_income, tax in expected.items():
+        assert Payment.calculate_income_tax(annual_income / 26) * 26 == pytest.approx(tax)
+
+
+@pytest.mark.parametrize('admin_fee_rate', [0.0, 0.1, 0.17, 0.25, 0.32, 0.4, 0.46, 0.5])
+def test_packaging_optimiser_matches_grid_search(admin_fee_rate):
+    annual_gross = np.array([0, 10000, 18200, 20000, 47000, 52000, 100000, 136000, 140000, 192000, 250000])
+    staff = pd.DataFrame({'total_payments': annual_gross / 26})
+
+    result = Payment.optimise_salary_packaging(staff, admin_fee_rate=admin_fee_rate, period='annual')
+
+    for gross, take_home in zip(annual_gross, result['take_home']):
+        packaging = np.linspace(0, min(Payment.SALARY_PACKAGING_ANNUAL_CAP, gross), 9011)
+        grid = gross - Payment.calculate_annual_tax_vectorized(gross - packaging) - packaging * admin_fee_rate
+        assert take_home == pytest.approx(grid.max(), abs=1e-6)
+
+
+def test_packaging_optimiser_per_row_columns_and_period():
+    staff = pd.DataFrame({
+        'total_payments': [4000.0, 4000.0, 4000.0],
+        'packaging_cap': [9010.0, 2600.0, 9010.0],
+        'admin_fee_rate': [0.0, 0.0, 0.5],
+    }, index=['a', 'b', 'c'])
+
+    result = Payment.optimise_salary_packaging(staff)
+
+    assert list(result.index) == ['a', 'b', 'c']
+    assert result['recommended_packaging'].tolist() == pytest.approx([9010 / 26, 100.0, 0.0])
+    assert result.loc['c', 'take_home_gain'] == 0
+    assert result.loc['a', 'marginal_rate'] == pytest.approx(0.32)
+
+
+@pytest.mark.parametrize('column, value', [
+    ('total_payments', -100.0),
+    ('total_payments', np.nan),
+    ('packaging_cap', np.nan),
+    ('packaging_cap', -1.0),
+])
+def test_packaging_optimiser_rejects_invalid_rows(column, value):
+    staff = pd.DataFrame({'total_payments': [3000.0, 3000.0], 'packaging_cap': [9010.0, 9010.0]})
+    staff.loc[1, column] = value
+
+    with pytest.raises(ValueError, match=column):
+        Payment.optimise_salary_packaging(staff)
+
+
+def test_compute_pay_takes_packaging_before_tax():
+    pay = Payment.compute_pay(**PAY_INPUTS)
+
+    taxable_income = pay['total_payments'] - PAY_INPUTS['salary_packaging']
+    expected_tax = (Payment.calculate_income_tax(taxable_income) +
+                    taxable_income * Payment.MEDICARE_LEVY_RATE)
+    assert pay['taxable_income'] == pytest.approx(taxable_income)
+    assert pay['income_tax'] == pytest.approx(expected_tax)
+    assert pay['net_pay'] == pytest.approx(
+        pay['total_payments'] - expected_tax - PAY_INPUTS['car_park'] - PAY_INPUTS['salary_packaging'])
+
+
+def test_compute_pay_clamps_taxable_income_at_zero():
+    no_hours = {field: 0.0 for field in Payment.PAY_HOUR_FIELDS}
+    pay = Payment.compute_pay(**dict(PAY_INPUTS, **no_hours))
+
+    assert pay['total_payments'] == pytest.approx(223.80)
+    assert pay['taxable_income'] == 0
+    assert pay['income_tax'] == 0
+
+
+def test_validation_flags_packaging_above_gross_pay():
+    no_hours = {field: 0.0 for field in Payment.PAY_HOUR_FIELDS}
+    batch = pd.DataFrame([PAY_INPUTS, dict(PAY_INPUTS, **no_hours)])
+
+    errors = Payment.validate_pay_inputs(batch)
+
+    assert errors.to_dict('records') == [{'row': 1, 'field': 'salary_packaging', 'rule': 'max_gross_pay'}]
+
+
+def validation_errors(*rows, index=None):
+    batch = pd.DataFrame([dict(PAY_INPUTS, **row) for row in rows], index=index)
+    return Payment.validate_pay_inputs(batch).to_dict('records')
+
+
+def test_validation_accepts_valid_rows():
+    assert validation_errors({}, {'salary_packaging': 0.0}) == []
+
+
+@pytest.mark.parametrize('overrides, field, rule', [
+    ({'hourly_rate': None}, 'hourly_rate', 'missing'),
+    ({'start_date': None}, 'start_date', 'missing'),
+    ({'hourly_rate': 'abc'}, 'hourly_rate', 'invalid'),
+    ({'end_date': 'not a date'}, 'end_date', 'invalid'),
+    ({'overtime_15_hours': -1.0}, 'overtime_15_hours', 'non_negative'),
+    ({'car_park': -5.0}, 'car_park', 'non_negative'),
+    ({'on_call_hours': 300.0}, 'total_hours', 'max_fortnight_hours'),
+    ({'super_rate': 150.0}, 'super_rate', 'max_percentage'),
+    ({'salary_packaging': 10000.0}, 'salary_packaging', 'max_gross_pay'),
+    ({'end_date': date(2025, 7, 1)}, 'end_date', 'end_before_start'),
+    ({'end_date': date(2025, 7, 21)}, 'end_date', 'fortnight_length'),
+])
+def test_validation_rules(overrides, field, rule):
+    assert validation_errors({}, overrides) == [{'row': 1, 'field': field, 'rule': rule}]
+
+
+def test_validation_reports_every_rule_a_row_breaks():
+    errors = validation_errors(
+        {},
+        {'hourly_rate': 'abc', 'overtime_20_hours': -2.0, 'on_call_hours': 400.0,
+         'super_rate': 120.0, 'start_date': 'not a date'},
+        {'end_date': date(2025, 7, 1)},
+        index=['x', 'y', 'z'],
+    )
+
+    assert errors == [
+        {'row': 'y', 'field': 'overtime_20_hours', 'rule': 'non_negative'},
+        {'row': 'y', 'field': 'hourly_rate', 'rule': 'invalid'},
+        {'row': 'y', 'field': 'total_hours', 'rule': 'max_fortnight_hours'},
+        {'row': 'y', 'field': 'super_rate', 'rule': 'max_percentage'},
+        {'row': 'y', 'field': 'start_date', 'rule': 'invalid'},
+        {'row': 'z', 'field': 'end_date', 'rule': 'end_before_start'},
+    ]
+
+
+def test_validation_requires_every_column():
+    batch = pd.DataFrame([PAY_INPUTS]).drop(columns=['hourly_rate'])
+
+    with pytest.raises(ValueError, match='hourly_rate'):
+        Payment.validate_pay_inputs(batch)
+
+
+def test_validation_flags_infinite_numbers():
+    assert validation_errors({}, {'hourly_rate': np.inf}) == [{'row': 1, 'field': 'hourly_rate', 'rule': 'invalid'}]
+
+
+def test_rows_that_validate_clean_run_through_compute_pay(tmp_path):
+    # (raw overrides, the typed overrides compute_pay should see, or None if the row is invalid)
+    rows = [
+        ({}, {}),
+        ({'hourly_rate': '45'}, {'hourly_rate': 45.0}),
+        ({'start_date': '2025-07-07', 'end_date': '2025-07-20'}, {}),
+        ({'total_standard_hours': 90.5, 'salary_packaging': 0.0}, {'total_standard_hours': 90.5, 'salary_packaging': 0.0}),
+        ({'hourly_rate': 'abc'}, None),
+        ({'hourly_rate': np.inf}, None),
+        ({'end_date': 'not a date'}, None),
+    ]
+    index = [f'emp{i}' for i in range(len(rows))]
+    batch = pd.DataFrame([dict(PAY_INPUTS, **raw) for raw, _ in rows], index=index)
+    batch.to_csv(tmp_path / 'batch.csv')
+    round_tripped = pd.read_csv(tmp_path / 'batch.csv', index_col=0)
+    fields = Payment.PAY_HOUR_FIELDS + Payment.PAY_AMOUNT_FIELDS + Payment.PAY_DATE_FIELDS
+
+    for frame in (batch, round_tripped):
+        errors = Payment.validate_pay_inputs(frame)
+        assert sorted(set(errors['row'])) == [name for name, (_, typed) in zip(index, rows) if typed is None]
+
+        coerced = Payment.coerce_pay_inputs(frame)
+        for name, (_, typed) in zip(index, rows):
+            if typed is None:
+                continue
+            pay = Payment.compute_pay(**coerced.loc[name, fields].to_dict())
+            expected = Payment.compute_pay(**dict(PAY_INPUTS, **typed))
+            assert pay['net_pay'] == pytest.approx(expected['net_pay'])
+            assert (pay['start_date'], pay['end_date']) == ('2025-07-07', '2025-07-20')